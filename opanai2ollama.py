@@ -12,26 +12,32 @@ from ttkbootstrap.scrolled import ScrolledText
 import json
 import os
 import sys
+import importlib.util
 import threading
 import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
 import queue
+from collections import deque
 import webbrowser
+import weakref
 from typing import List, Optional
 import subprocess
 import signal
 import time
 import gettext
 import builtins
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 # pip install ttkbootstrap fastapi uvicorn httpx httpx[http2] pydantic pillow pystray
 
-from fastapi import FastAPI, Request
-from fastapi.responses import StreamingResponse
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse, ORJSONResponse
 import uvicorn
 import httpx
+import orjson
 from PIL import Image, ImageDraw
 import pystray
 from pystray import MenuItem as Item
@@ -41,8 +47,14 @@ from pystray import MenuItem as Item
 # 默认使用 gettext, LocaleManager 将会覆盖它
 builtins._ = gettext.gettext
 
+def N_(message):
+    """无操作标记: 字符串延迟到显示时才翻译, 但仍可被xgettext提取"""
+    return message
+
 class LocaleManager:
     """管理应用程序的语言环境"""
+    _languages_cache = None  # 目录扫描结果, 进程内不会变化
+
     def __init__(self, locale_dir='locales'):
         if getattr(sys, 'frozen', False):
             self.locale_dir = Path(sys._MEIPASS) / locale_dir
@@ -50,17 +62,25 @@ class LocaleManager:
             self.locale_dir = Path(__file__).parent / locale_dir
         
         self.supported_languages = self.get_supported_languages()
+        # 菜单展示用的(code, name)列表, 按显示名排序并随扫描结果一起缓存
+        self.sorted_languages = sorted(self.supported_languages.items(), key=lambda kv: kv[1])
         self.current_lang = 'en'
+        self._translations = {}  # 已加载的翻译对象, 按语言代码缓存
+        self._active_gettext = gettext.gettext  # 当前语言的原始gettext查找
 
     def get_supported_languages(self) -> dict:
         """扫描locale目录以查找支持的语言"""
+        if LocaleManager._languages_cache is not None:
+            return LocaleManager._languages_cache
         languages = {'en_US': 'English'} # 默认支持英文
         if not self.locale_dir.is_dir():
             return languages
-        for lang_dir in self.locale_dir.iterdir():
-            if (lang_dir / "LC_MESSAGES" / "messages.mo").exists():
-                # 通常需要一个更稳健的方法来获取语言名称，这里我们用目录名
-                languages[lang_dir.name] = lang_dir.name.upper() # 示例: ZH, DE
+        # 单次glob即可找到所有已编译的语言, 避免逐目录stat
+        for mo in self.locale_dir.glob("*/LC_MESSAGES/messages.mo"):
+            # 通常需要一个更稳健的方法来获取语言名称，这里我们用目录名
+            lang = mo.parent.parent.name
+            languages[lang] = lang.upper() # 示例: ZH, DE
+        LocaleManager._languages_cache = languages
         return languages
 
     def switch_language(self, lang: str):
@@ -69,22 +89,42 @@ class LocaleManager:
             lang = 'en_US'
         self.current_lang = lang
         try:
-            translation = gettext.translation('messages', localedir=str(self.locale_dir), languages=[lang])
-            builtins._ = translation.gettext
+            # 缓存翻译对象, 重复切换语言时不再重新解析.mo文件
+            translation = self._translations.get(lang)
+            if translation is None:
+                translation = gettext.translation('messages', localedir=str(self.locale_dir), languages=[lang])
+                self._translations[lang] = translation
+            self._active_gettext = translation.gettext
         except FileNotFoundError:
             # 如果找不到 .mo 文件，则回退到默认的 no-op 翻译
-            builtins._ = gettext.gettext
+            self._active_gettext = gettext.gettext
             print(f"Warning: Could not find locale data for language: {lang}")
+        _cached_lookup.cache_clear()
+        builtins._ = _translate
 
 # 初始化语言管理器
 locale_manager = LocaleManager()
 
+@lru_cache(maxsize=512)
+def _cached_lookup(lang, message):
+    return locale_manager._active_gettext(message)
+
+def _translate(message):
+    """_()的缓存前端: 重复的msgid查找退化为一次dict取值"""
+    return _cached_lookup(locale_manager.current_lang, message)
+
 # --- 日志和版本 ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 VERSION = "1.0.1"
 OLLAMA_VERSION = "0.11.4"
+MAX_LOG_LINES = 5000  # 日志视图保留的最大行数, Tk文本布局开销随总行数增长
+
+# Treeview样式按主题预先定义, 避免每次切换主题时重建字典
+DARK_TREE_CONFIG = {"borderwidth": 1, "relief": "solid", "rowheight": 25, "background": "#2b2b2b", "fieldbackground": "#2b2b2b", "foreground": "white"}
+LIGHT_TREE_CONFIG = {"borderwidth": 1, "relief": "solid", "rowheight": 25, "background": "white", "fieldbackground": "white", "foreground": "black"}
+TREE_MAP_CONFIG = {"background": [("selected", "#0d6efd")], "foreground": [("selected", "white")]}
 ENABLE_TRAY = False
 
 # 全局变量
@@ -107,6 +147,14 @@ class Settings:
         # 拦截模型列表配置
         self.intercept_models_enabled = False
         self.intercepted_models = []  # 存储被拦截的模型列表
+        # 拦截响应缓存(已序列化的字节), 模型列表只在保存设置时变化
+        self._tags_cache_bytes: Optional[bytes] = None
+        self._openai_models_cache_bytes: Optional[bytes] = None
+
+    def invalidate_model_cache(self):
+        """拦截模型列表变更后使缓存的响应失效"""
+        self._tags_cache_bytes = None
+        self._openai_models_cache_bytes = None
 
 class Oai2OllamaServer:
     """OpenAI to Ollama API Bridge Server"""
@@ -114,32 +162,54 @@ class Oai2OllamaServer:
     def __init__(self, settings: Settings, log_callback=None):
         self.settings = settings
         self.log_callback = log_callback
-        self.app = FastAPI(title="Oai2Ollama", version=VERSION)
+        self.app = FastAPI(title="Oai2Ollama", version=VERSION, default_response_class=ORJSONResponse)
         self.server = None
         self.server_thread = None
+        self._server_loop = None
         self.is_running = False
+        self.client = None
+        self._client_identity = None  # 构建client时使用的(api_key, base_url)
         self._setup_routes()
 
+    async def _ensure_client(self):
+        """仅在api_key或base_url变化时重建客户端, 否则保留现有连接池"""
+        identity = (self.settings.api_key, self.settings.base_url)
+        if self.client is not None and identity == self._client_identity:
+            return
+        if self.client is not None:
+            await self.client.aclose()
+        self.client = httpx.AsyncClient(
+            base_url=self.settings.base_url,
+            headers={"Authorization": f"Bearer {self.settings.api_key}"},
+            timeout=60,
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+        self._client_identity = identity
+
     def log(self, message, level="INFO"):
         """记录日志"""
         if self.log_callback:
             self.log_callback(f"[{level}] {message}")
         logger.log(getattr(logging, level), message)
 
-    def _create_client(self) -> httpx.AsyncClient:
-        """创建HTTP客户端"""
-        headers = {"Authorization": f"Bearer {self.settings.api_key}"}
-        return httpx.AsyncClient(
-            base_url=self.settings.base_url,
-            headers=headers,
-            timeout=60,
-            http2=True,
-            follow_redirects=True
-        )
-
     def _setup_routes(self):
         """设置API路由"""
 
+        @self.app.on_event("startup")
+        async def startup():
+            # 所有请求共享一个客户端, 复用keep-alive连接和HTTP/2流,
+            # 避免每次代理请求都重新进行TCP+TLS握手
+            await self._ensure_client()
+
+        @self.app.on_event("shutdown")
+        async def shutdown():
+            if self.client:
+                await self.client.aclose()
+                self.client = None
+                self._client_identity = None
+
         @self.app.get("/")
         async def root():
             """根路径"""
@@ -154,36 +224,34 @@ class Oai2OllamaServer:
             """获取模型列表 (Ollama格式)"""
             if self.settings.intercept_models_enabled:
                 self.log("Intercepting /api/tags, returning models from local config.", "INFO")
-                enabled_models = [m for m in self.settings.intercepted_models if m.get('enabled', False)]
-                ollama_models = [{
-                    "name": model["id"],
-                    "model": model["id"],
-                    "modified_at": datetime.now().isoformat(),
-                    "size": 0,
-                    "digest": "",
-                    "details": {
-                        "format": "gguf",
-                        "family": "custom",
-                        "families": None,
-                        "parameter_size": "N/A",
-                        "quantization_level": "Q0"
-                     }
-                } for model in enabled_models]
-                return {"models": ollama_models}
+                # 列表只在保存设置时变化, 缓存序列化后的字节直接返回
+                if self.settings._tags_cache_bytes is None:
+                    enabled_models = [m for m in self.settings.intercepted_models if m.get('enabled', False)]
+                    now_iso = datetime.now().isoformat()
+                    ollama_models = [{
+                        "name": model["id"],
+                        "model": model["id"],
+                        "modified_at": now_iso,
+                        "size": 0,
+                        "digest": "",
+                        "details": {
+                            "format": "gguf",
+                            "family": "custom",
+                            "families": None,
+                            "parameter_size": "N/A",
+                            "quantization_level": "Q0"
+                         }
+                    } for model in enabled_models]
+                    self.settings._tags_cache_bytes = orjson.dumps({"models": ollama_models})
+                return Response(content=self.settings._tags_cache_bytes, media_type="application/json")
 
             try:
-                async with self._create_client() as client:
-                    res = await client.get("/models")
-                    res.raise_for_status()
-                    data = res.json()
-                    models_map = {}
-                    if "data" in data:
-                        for model in data["data"]:
-                            model_id = model["id"]
-                            models_map[model_id] = {"name": model_id, "model": model_id}
-                    for model_name in self.settings.models:
-                        models_map[model_name] = {"name": model_name, "model": model_name}
-                    return {"models": list(models_map.values())}
+                res = await self.client.get("/models")
+                res.raise_for_status()
+                data = orjson.loads(res.content)
+                models_map = {m["id"]: {"name": m["id"], "model": m["id"]} for m in data.get("data", ())}
+                models_map.update({name: {"name": name, "model": name} for name in self.settings.models})
+                return Response(content=orjson.dumps({"models": list(models_map.values())}), media_type="application/json")
             except Exception as e:
                 self.log(f"Error fetching models: {e}", "ERROR")
                 return {"models": []}
@@ -220,20 +288,22 @@ class Oai2OllamaServer:
             """列出模型 (OpenAI格式)"""
             if self.settings.intercept_models_enabled:
                 self.log("Intercepting /v1/models, returning models from local config.", "INFO")
-                enabled_models = [m for m in self.settings.intercepted_models if m.get('enabled', False)]
-                openai_models = [{
-                    "id": model["id"],
-                    "object": "model",
-                    "created": int(time.time()),
-                    "owned_by": model.get("owned_by", "user")
-                } for model in enabled_models]
-                return {"object": "list", "data": openai_models}
+                if self.settings._openai_models_cache_bytes is None:
+                    enabled_models = [m for m in self.settings.intercepted_models if m.get('enabled', False)]
+                    created = int(time.time())
+                    openai_models = [{
+                        "id": model["id"],
+                        "object": "model",
+                        "created": created,
+                        "owned_by": model.get("owned_by", "user")
+                    } for model in enabled_models]
+                    self.settings._openai_models_cache_bytes = orjson.dumps({"object": "list", "data": openai_models})
+                return Response(content=self.settings._openai_models_cache_bytes, media_type="application/json")
             
             try:
-                async with self._create_client() as client:
-                    res = await client.get("/models")
-                    res.raise_for_status()
-                    return res.json()
+                res = await self.client.get("/models")
+                res.raise_for_status()
+                return res.json()
             except Exception as e:
                 self.log(f"Error listing models: {e}", "ERROR")
                 return {"data": [], "object": "list"}
@@ -245,16 +315,26 @@ class Oai2OllamaServer:
                 data = await request.json()
                 if data.get("stream", False):
                     async def stream():
-                        async with self._create_client() as client:
-                            async with client.stream("POST", "/chat/completions", json=data) as response:
-                                async for chunk in response.aiter_bytes():
-                                    yield chunk
-                    return StreamingResponse(stream(), media_type="text/event-stream")
+                        # aiter_raw跳过httpx的解压层, 原样转发上游字节;
+                        # 请求identity编码保证原始字节就是合法的SSE
+                        async with self.client.stream(
+                            "POST", "/chat/completions", json=data,
+                            headers={"Accept-Encoding": "identity"}
+                        ) as response:
+                            async for chunk in response.aiter_raw(chunk_size=65536):
+                                yield chunk
+                    return StreamingResponse(
+                        stream(), media_type="text/event-stream",
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+                    )
                 else:
-                    async with self._create_client() as client:
-                        res = await client.post("/chat/completions", json=data)
-                        res.raise_for_status()
-                        return res.json()
+                    # 原样转发上游字节, 省掉一次JSON解析和一次重新序列化
+                    res = await self.client.post("/chat/completions", json=data)
+                    return Response(
+                        content=res.content,
+                        status_code=res.status_code,
+                        media_type=res.headers.get("content-type", "application/json")
+                    )
             except Exception as e:
                 self.log(f"Error in chat completions: {e}", "ERROR")
                 return {"error": str(e)}, 500
@@ -275,11 +355,33 @@ class Oai2OllamaServer:
         self.log(f"Extra models: {self.settings.models}", "INFO")
         def run_server():
             try:
+                # uvloop仅支持POSIX; Windows或未安装时回退到默认asyncio循环
+                use_uvloop = sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None
+                use_httptools = importlib.util.find_spec("httptools") is not None
                 config = uvicorn.Config(
-                    self.app, host=self.settings.host, port=self.settings.port, log_level="info"
+                    self.app, host=self.settings.host, port=self.settings.port, log_level="info",
+                    loop="uvloop" if use_uvloop else "asyncio",
+                    http="httptools" if use_httptools else "h11",
+                    timeout_keep_alive=30
                 )
                 self.server = uvicorn.Server(config)
-                self.server.run()
+                # 显式持有事件循环, stop()通过call_soon_threadsafe请求关闭,
+                # 避免从Tk线程直接改should_exit的竞态
+                if hasattr(config, 'get_loop_factory'):
+                    # uvicorn>=0.36: uvloop由loop工厂选择, 必须用工厂建循环
+                    loop_factory = config.get_loop_factory()
+                    loop = loop_factory() if loop_factory is not None else asyncio.new_event_loop()
+                else:
+                    # 旧版uvicorn通过全局事件循环策略选择uvloop
+                    config.setup_event_loop()
+                    loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+                self._server_loop = loop
+                try:
+                    loop.run_until_complete(self.server.serve())
+                finally:
+                    self._server_loop = None
+                    loop.close()
             except Exception as e:
                 self.log(f"Server error: {e}", "ERROR")
                 self.is_running = False
@@ -293,10 +395,48 @@ class Oai2OllamaServer:
         self.is_running = False
         self.log("Stopping server...", "INFO")
         if self.server:
-            self.server.should_exit = True
+            server, loop = self.server, self._server_loop
+            if loop is not None:
+                try:
+                    loop.call_soon_threadsafe(setattr, server, "should_exit", True)
+                except RuntimeError:
+                    # 循环在读取self._server_loop之后恰好结束并关闭
+                    server.should_exit = True
+            else:
+                server.should_exit = True
             self.server = None
         self.log("Server stopped", "INFO")
 
+_JSON_WS = ' \t\n\r'
+
+def _iter_json_array_items(json_string, start):
+    """增量解析顶层JSON数组并逐个产出元素
+
+    基于JSONDecoder.raw_decode逐元素解码, 校验方在首个非法元素处即可
+    中止, 不必先把整份配置构建成对象树。start是'['的下标。
+    """
+    decoder = json.JSONDecoder()
+    n = len(json_string)
+    idx = start + 1
+    while idx < n and json_string[idx] in _JSON_WS: idx += 1
+    if idx < n and json_string[idx] == ']':
+        idx += 1
+    else:
+        while True:
+            obj, idx = decoder.raw_decode(json_string, idx)
+            yield obj
+            while idx < n and json_string[idx] in _JSON_WS: idx += 1
+            if idx >= n or json_string[idx] not in ',]':
+                raise json.JSONDecodeError("Expecting ',' delimiter", json_string, idx)
+            if json_string[idx] == ']':
+                idx += 1
+                break
+            idx += 1
+            while idx < n and json_string[idx] in _JSON_WS: idx += 1
+    while idx < n and json_string[idx] in _JSON_WS: idx += 1
+    if idx != n:
+        raise json.JSONDecodeError("Extra data", json_string, idx)
+
 class ModelInterceptWindow(tk.Toplevel):
     """模型拦截设置窗口"""
     def __init__(self, parent, settings_manager, on_save_callback):
@@ -318,6 +458,9 @@ class ModelInterceptWindow(tk.Toplevel):
         self.all_intercepted_models = []
         self.is_filtering = False
         self.filtered_models = []
+        self._models_owned = False
+        self._search_haystacks = []
+        self._http_client = None  # 懒加载, 多次"获取模型列表"复用连接
         
         self.create_ui()
         self.update_ui_texts()
@@ -327,6 +470,19 @@ class ModelInterceptWindow(tk.Toplevel):
         self.focus_set()
         self.protocol("WM_DELETE_WINDOW", self.destroy)
 
+    def _get_http_client(self) -> httpx.Client:
+        """返回共享的HTTP客户端, 重复拉取模型列表时复用TLS会话和连接池"""
+        if self._http_client is None:
+            headers = {"Authorization": f"Bearer {self.settings.api_key}"} if self.settings.api_key else {}
+            self._http_client = httpx.Client(headers=headers, timeout=30, http2=True)
+        return self._http_client
+
+    def destroy(self):
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+        super().destroy()
+
     def create_ui(self):
         main_frame = ttk.Frame(self, padding=10)
         main_frame.pack(fill=BOTH, expand=True)
@@ -390,7 +546,7 @@ class ModelInterceptWindow(tk.Toplevel):
         self.list_frame.pack(fill=BOTH, expand=True, pady=(0, 10))
         columns = ("enabled", "model_id", "model_name", "object_type", "owned_by")
         self.model_tree = ttk.Treeview(self.list_frame, columns=columns, show="headings", height=15)
-        for col in columns: self.model_tree.heading(col, text=col)
+        # 表头文字统一由update_ui_texts设置, 这里不再预填占位符
         self.model_tree.column("enabled", width=60, minwidth=60, anchor='center')
         self.model_tree.column("model_id", width=200, minwidth=150)
         self.model_tree.column("model_name", width=200, minwidth=150)
@@ -425,28 +581,58 @@ class ModelInterceptWindow(tk.Toplevel):
         self.context_menu.add_command(label="", command=self.delete_selected_models)
     
     # ... (rest of the methods for ModelInterceptWindow)
+    @staticmethod
+    def _sort_key(model):
+        """启用的模型排在前, 其余按ID字典序"""
+        return (not model.get('enabled', False), model.get('id', ''))
+
     def refresh_model_tree(self):
-        for item in self.model_tree.get_children():
-            self.model_tree.delete(item)
+        children = self.model_tree.get_children()
+        if children:
+            self.model_tree.delete(*children)
         models_to_show = self.filtered_models if self.is_filtering else self.all_intercepted_models
-        models_to_show.sort(key=lambda x: (not x.get('enabled', False), x.get('id', '')))
-        for model in models_to_show:
-            self.insert_model_into_tree(model)
-
-    def insert_model_into_tree(self, model_data):
-        self.model_tree.insert("", "end", iid=model_data.get('id', ''), values=(
-            "✔" if model_data.get("enabled", False) else "✖",
-            model_data.get("id", ""),
-            model_data.get("name", model_data.get("id", "")),
-            model_data.get("object", "model"),
-            model_data.get("owned_by", "unknown")
-        ))
-        
+        # 排序到局部副本; 过滤视图沿用主列表的既有顺序, 不重复排序
+        if not self.is_filtering:
+            models_to_show = sorted(models_to_show, key=self._sort_key)
+        rows = [(model.get('id', ''), (
+            "✔" if model.get("enabled", False) else "✖",
+            model.get("id", ""),
+            model.get("name", model.get("id", "")),
+            model.get("object", "model"),
+            model.get("owned_by", "unknown")
+        )) for model in models_to_show]
+        # 直接走Tcl调用插入, 跳过每行一次的ttk封装层开销
+        tk_call = self.model_tree.tk.call
+        widget = self.model_tree._w
+        for iid, values in rows:
+            tk_call(widget, "insert", "", "end", "-id", iid, "-values", values)
+
+
     def load_intercepted_models(self):
-        self.all_intercepted_models = [dict(m) for m in self.settings.intercepted_models]
+        # 先浅拷贝列表; 首次真正修改时才复制dict(写时复制), 大列表打开窗口不再逐项分配
+        self.all_intercepted_models = self.settings.intercepted_models[:]
+        self._models_owned = False
         self.is_filtering, self.filtered_models = False, []
+        self._rebuild_search_index()
         self.refresh_model_tree()
 
+    def _rebuild_search_index(self):
+        # 预生成小写检索串, 过滤时不再对每个模型每个关键词反复调用.lower()
+        self._search_haystacks = [
+            f"{m.get('id', '').lower()}\x00{m.get('name', '').lower()}\x00{m.get('owned_by', '').lower()}"
+            for m in self.all_intercepted_models
+        ]
+
+    def _ensure_owned(self):
+        """写时复制: 首次修改前把与settings共享的模型dict换成本窗口私有副本"""
+        if self._models_owned: return
+        owned = [dict(m) for m in self.all_intercepted_models]
+        if self.is_filtering:
+            by_id = {m.get('id'): m for m in owned}
+            self.filtered_models = [by_id[m.get('id')] for m in self.filtered_models if m.get('id') in by_id]
+        self.all_intercepted_models = owned
+        self._models_owned = True
+
     def on_search_text_changed(self, *args):
         if hasattr(self, '_filter_timer'): self.after_cancel(self._filter_timer)
         self._filter_timer = self.after(300, self.filter_models)
@@ -458,11 +644,10 @@ class ModelInterceptWindow(tk.Toplevel):
             return
         self.is_filtering = True
         keywords = [kw.strip() for kw in search_term.split() if kw.strip()]
-        self.filtered_models = []
-        for model in self.all_intercepted_models:
-            model_id, model_name, owned_by = model.get("id", "").lower(), model.get("name", "").lower(), model.get("owned_by", "").lower()
-            if all(keyword in model_id or keyword in model_name or keyword in owned_by for keyword in keywords):
-                self.filtered_models.append(model)
+        self.filtered_models = [
+            model for model, haystack in zip(self.all_intercepted_models, self._search_haystacks)
+            if all(keyword in haystack for keyword in keywords)
+        ]
         self.refresh_model_tree()
 
     def clear_filter(self):
@@ -487,15 +672,12 @@ class ModelInterceptWindow(tk.Toplevel):
         progress.start()
         def fetch_in_thread():
             try:
-                import httpx
                 api_url = self.settings.base_url.rstrip('/') + '/models'
-                headers = {"Authorization": f"Bearer {self.settings.api_key}"} if self.settings.api_key else {}
-                with httpx.Client(headers=headers, timeout=30) as client:
-                    response = client.get(api_url)
-                    response.raise_for_status()
-                    data = response.json()
-                    models = data.get('data', [])
-                    self.after(0, lambda: self.update_models_from_api(models))
+                response = self._get_http_client().get(api_url)
+                response.raise_for_status()
+                data = response.json()
+                models = data.get('data', [])
+                self.after(0, lambda: self.update_models_from_api(models))
             except Exception as e:
                 self.after(0, lambda: messagebox.showerror(_("Error"), _("Failed to fetch model list: {error}").format(error=e), parent=self))
             finally:
@@ -503,6 +685,7 @@ class ModelInterceptWindow(tk.Toplevel):
         threading.Thread(target=fetch_in_thread, daemon=True).start()
 
     def update_models_from_api(self, api_models):
+        self._ensure_owned()
         existing_models_map = {model['id']: model for model in self.all_intercepted_models}
         api_models_map = {model['id']: model for model in api_models}
         for model_id, api_model in api_models_map.items():
@@ -518,6 +701,8 @@ class ModelInterceptWindow(tk.Toplevel):
                     'owned_by': api_model.get('owned_by', 'unknown'), 'enabled': True
                 }
         self.all_intercepted_models = list(existing_models_map.values())
+        self._rebuild_search_index()
+        self.settings.invalidate_model_cache()
         self.clear_filter()
         messagebox.showinfo(_("Success"), _("Sync complete! Found {count} models.").format(count=len(api_models)), parent=self)
 
@@ -543,6 +728,7 @@ class ModelInterceptWindow(tk.Toplevel):
                 messagebox.showwarning(_("Warning"), _("This Model ID already exists"), parent=dialog); return
             new_model = {'id': model_id, 'name': model_name_var.get().strip() or model_id, 'object': 'model', 'owned_by': owned_by_var.get().strip() or 'custom', 'enabled': True}
             self.all_intercepted_models.append(new_model)
+            self._rebuild_search_index()
             self.refresh_model_tree(); dialog.destroy()
         btn_frame = ttk.Frame(frame); btn_frame.grid(row=3, column=0, columnspan=2, pady=20)
         ttk.Button(btn_frame, text=_("Add"), command=do_add, bootstyle=SUCCESS).pack(side=LEFT, padx=5)
@@ -556,9 +742,11 @@ class ModelInterceptWindow(tk.Toplevel):
             ids_to_delete = set(selected_items)
             self.all_intercepted_models = [m for m in self.all_intercepted_models if m.get('id') not in ids_to_delete]
             if self.is_filtering: self.filtered_models = [m for m in self.filtered_models if m.get('id') not in ids_to_delete]
+            self._rebuild_search_index()
             self.refresh_model_tree()
 
     def _toggle_visible_models_enabled(self, enable: bool):
+        self._ensure_owned()
         visible_ids = {self.model_tree.item(item)['values'][1] for item in self.model_tree.get_children()}
         for model in self.all_intercepted_models:
             if model.get('id') in visible_ids: model['enabled'] = enable
@@ -569,13 +757,15 @@ class ModelInterceptWindow(tk.Toplevel):
     def on_model_double_click(self, event):
         item_id = self.model_tree.identify_row(event.y)
         if not item_id: return
+        self._ensure_owned()
         for model in self.all_intercepted_models:
             if model.get('id') == item_id:
                 model['enabled'] = not model.get('enabled', False); break
         self.after(50, self.refresh_model_tree)
 
     def save_model_intercept_config(self):
-        self.settings.intercepted_models = sorted(self.all_intercepted_models, key=lambda x: (not x.get('enabled', False), x.get('id', '')))
+        self.settings.intercepted_models = sorted(self.all_intercepted_models, key=self._sort_key)
+        self.settings.invalidate_model_cache()
         if self.on_save_callback: self.on_save_callback()
         enabled_count = sum(1 for m in self.settings.intercepted_models if m.get('enabled'))
         msg = _("Settings saved. Total {total} models, {enabled} enabled.").format(total=len(self.settings.intercepted_models), enabled=enabled_count)
@@ -593,6 +783,7 @@ class ModelInterceptWindow(tk.Toplevel):
     def _toggle_selection_enabled(self, enable: bool):
         selected_ids = set(self.model_tree.selection())
         if not selected_ids: return
+        self._ensure_owned()
         for model in self.all_intercepted_models:
             if model.get('id') in selected_ids: model['enabled'] = enable
         self.refresh_model_tree()
@@ -614,12 +805,29 @@ class ModelInterceptWindow(tk.Toplevel):
         text_frame = ttk.Frame(main_frame); text_frame.pack(fill=BOTH, expand=True)
         json_text_widget = ScrolledText(text_frame, wrap="word", autohide=True, height=10)
         json_text_widget.pack(fill=BOTH, expand=True)
-        try:
-            current_config = json.dumps(self.all_intercepted_models, indent=2, ensure_ascii=False)
-            json_text_widget.insert("1.0", current_config)
-        except Exception as e:
-            messagebox.showerror(_("Error"), _("Failed to load current model configuration: {error}").format(error=e), parent=edit_window)
-            json_text_widget.insert("1.0", f"// {_('Failed to load configuration')}: {e}\n[]")
+        # 大列表的序列化放到工作线程, 避免冻结Tk主线程; orjson比json快数倍
+        loading_window = tk.Toplevel(edit_window)
+        loading_window.title(_("Please wait"))
+        loading_window.transient(edit_window)
+        loading_window.grab_set()
+        lx, ly = edit_window.winfo_x() + 200, edit_window.winfo_y() + 200
+        loading_window.geometry(f"300x100+{lx}+{ly}")
+        ttk.Label(loading_window, text=_("Loading configuration...")).pack(pady=20)
+        loading_progress = ttk.Progressbar(loading_window, mode='indeterminate')
+        loading_progress.pack(pady=5, padx=20, fill=X)
+        loading_progress.start()
+        def serialize_in_thread():
+            try:
+                current_config = orjson.dumps(self.all_intercepted_models, option=orjson.OPT_INDENT_2).decode('utf-8')
+                self.after(0, lambda: json_text_widget.insert("1.0", current_config))
+            except Exception as e:
+                def show_error(e=e):
+                    messagebox.showerror(_("Error"), _("Failed to load current model configuration: {error}").format(error=e), parent=edit_window)
+                    json_text_widget.insert("1.0", f"// {_('Failed to load configuration')}: {e}\n[]")
+                self.after(0, show_error)
+            finally:
+                self.after(0, loading_window.destroy)
+        threading.Thread(target=serialize_in_thread, daemon=True).start()
         button_frame = ttk.Frame(main_frame); button_frame.pack(fill=X, pady=(10, 0))
         def save_and_apply(): self.save_json_config(json_text_widget, edit_window)
         ttk.Button(button_frame, text=_("✅ Validate Format"), command=lambda: self.validate_json_config(json_text_widget.get("1.0", "end-1c"), parent=edit_window)).pack(side=LEFT)
@@ -628,33 +836,42 @@ class ModelInterceptWindow(tk.Toplevel):
         ttk.Button(button_frame, text=_("❌ Cancel"), command=edit_window.destroy).pack(side=RIGHT, padx=5)
 
     def validate_json_config(self, json_string, parent):
+        """验证并解析JSON配置, 返回(是否通过, 解析结果); 调用方可直接复用解析结果"""
         try:
-            data = json.loads(json_string)
-            if not isinstance(data, list):
-                messagebox.showerror(_("Validation Failed"), _("Top-level structure must be a JSON array (list)."), parent=parent); return False
-            for i, item in enumerate(data):
+            start = len(json_string) - len(json_string.lstrip())
+            if start >= len(json_string) or json_string[start] != '[':
+                # 非数组开头: 完整解析一次以区分"合法但非数组"和"非法JSON"
+                json.loads(json_string)
+                messagebox.showerror(_("Validation Failed"), _("Top-level structure must be a JSON array (list)."), parent=parent); return False, None
+            # 逐元素增量解析, 首个结构违规即中止, 不为报错构建整棵树
+            data = []
+            for i, item in enumerate(_iter_json_array_items(json_string, start)):
                 if not isinstance(item, dict):
-                    messagebox.showerror(_("Validation Failed"), _("Item #{num} is not a valid JSON object (dictionary).").format(num=i+1), parent=parent); return False
+                    messagebox.showerror(_("Validation Failed"), _("Item #{num} is not a valid JSON object (dictionary).").format(num=i+1), parent=parent); return False, None
                 if 'id' not in item:
-                    messagebox.showerror(_("Validation Failed"), _("Item #{num} is missing the required 'id' field.").format(num=i+1), parent=parent); return False
-            messagebox.showinfo(_("Success"), _("JSON configuration validation passed!"), parent=parent); return True
+                    messagebox.showerror(_("Validation Failed"), _("Item #{num} is missing the required 'id' field.").format(num=i+1), parent=parent); return False, None
+                data.append(item)
+            messagebox.showinfo(_("Success"), _("JSON configuration validation passed!"), parent=parent); return True, data
         except json.JSONDecodeError as e:
-            messagebox.showerror(_("JSON Error"), _("Invalid JSON format: {error}").format(error=e), parent=parent); return False
+            messagebox.showerror(_("JSON Error"), _("Invalid JSON format: {error}").format(error=e), parent=parent); return False, None
 
     def format_json_config(self, text_widget):
         try:
             current_text = text_widget.get("1.0", "end-1c")
-            data = json.loads(current_text)
-            formatted_text = json.dumps(data, indent=2, ensure_ascii=False)
+            # orjson在C层完成解析和编码, 非法输入也在构建对象图前更早失败
+            data = orjson.loads(current_text)
+            formatted_text = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
             text_widget.delete("1.0", "end"); text_widget.insert("1.0", formatted_text)
         except Exception as e:
             messagebox.showerror(_("Formatting Failed"), _("Could not format JSON: {error}").format(error=e), parent=text_widget.winfo_toplevel())
 
     def save_json_config(self, text_widget, window):
         json_string = text_widget.get("1.0", "end-1c")
-        if not self.validate_json_config(json_string, parent=window): return
-        new_config = json.loads(json_string)
+        ok, new_config = self.validate_json_config(json_string, parent=window)
+        if not ok: return
         self.all_intercepted_models = new_config
+        self._models_owned = True
+        self._rebuild_search_index()
         self.refresh_model_tree()
         window.destroy()
         messagebox.showinfo(_("Success"), _("Advanced edits applied.\nPlease remember to click the 'Save' button in the main settings window to persist changes."), parent=self)
@@ -671,6 +888,9 @@ class MainApplication:
             self.config_path = self.base_path / "config.json"
 
         self.settings = Settings()
+        self._save_after_id = None  # 待执行的防抖配置写入
+        # 单工作线程串行执行所有磁盘写入, Tk主线程不再被I/O阻塞
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
         self.load_config()
         
         locale_manager.switch_language(self.settings.language)
@@ -679,6 +899,13 @@ class MainApplication:
         self.setup_window()
         self.server = None
         self.log_queue = queue.Queue()
+        self._log_ts_cache = (None, "")  # (秒, 已格式化时间戳)
+        self._about_text = None  # 懒构建, 切换语言时置空
+        # 可本地化的子窗口注册表; WeakSet在窗口销毁后自动剔除
+        self._localizable_toplevels = weakref.WeakSet()
+        self._icon_image = None  # 托盘PIL图像, 见icon_image属性
+        self._icon_source = None
+        self._active_tree_theme = None  # 上次应用的Treeview主题
         
         self.create_ui()
         self.update_ui_texts() # 初始化UI文本
@@ -688,13 +915,14 @@ class MainApplication:
         if ENABLE_TRAY: self.setup_tray()
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.root.bind("<Unmap>", self.on_minimize)
+        # 日志到达时由虚拟事件唤醒, 不再以100ms间隔空转轮询
+        self.root.bind("<<LogArrived>>", self.drain_logs)
         self.apply_saved_config()
         if self.settings.auto_start and self.settings.start_minimized:
             self.root.after(100, self.minimize_to_tray)
             self.root.after(200, self.start_server)
         elif self.settings.auto_start:
             self.root.after(100, self.start_server)
-        self.update_logs()
 
     def setup_window(self):
         width, height = 900, 700
@@ -710,55 +938,72 @@ class MainApplication:
         self.create_config_frame(main_frame)
         self.create_log_frame(main_frame)
         self.create_statusbar()
+        # 静态可本地化控件的注册表, update_ui_texts按表刷新;
+        # 文字随状态变化的控件(主题按钮/状态栏)仍单独处理
+        self._i18n_widgets = [
+            (self.settings_btn, N_("⚙️ Settings")),
+            (self.about_btn, N_("ℹ️ About")),
+            (self.stop_btn, N_("⏹️ Stop")),
+            (self.start_btn, N_("▶️ Start")),
+            (self.config_frame, N_("Server Configuration")),
+            (self.api_key_label, N_("API Key:")),
+            (self.show_key_check, N_("Show")),
+            (self.base_url_label, N_("Base URL:")),
+            (self.listen_addr_label, N_("Listen Address:")),
+            (self.port_label, N_("Port:")),
+            (self.open_docs_btn, N_("Open API Docs")),
+            (self.capabilities_label, N_("Capabilities:")),
+            (self.capabilities_hint, N_("(comma-separated, e.g., tools, vision, embedding)")),
+            (self.intercept_label, N_("Intercept Model List:")),
+            (self.intercept_check, N_("Enable")),
+            (self.intercept_settings_btn, N_("Settings")),
+            (self.extra_models_label, N_("Extra Models:")),
+            (self.extra_models_hint, N_("(comma-separated, e.g., gpt-4, gpt-3.5-turbo)")),
+            (self.log_frame, N_("Server Log")),
+            (self.clear_log_btn, N_("Clear Log")),
+            (self.save_log_btn, N_("Save Log")),
+            (self.auto_scroll_check, N_("Auto-scroll")),
+        ]
         
     def switch_language_and_update_ui(self, lang_code):
         locale_manager.switch_language(lang_code)
         self.settings.language = lang_code
+        self._about_text = None  # 关于文本按当前语言缓存
         self.save_config()
         self.update_ui_texts()
-        # 更新所有子窗口
-        for win in self.root.winfo_children():
-            if isinstance(win, tk.Toplevel) and hasattr(win, 'update_ui_texts'):
+        # 只遍历显式注册的子窗口, 不再扫描winfo_children()逐个做类型判断
+        for win in self._localizable_toplevels:
+            if win.winfo_exists():
                 win.update_ui_texts()
 
+    @staticmethod
+    def _set_if_diff(widget, key, value):
+        """仅在值确实变化时调用config, Tk对每次config都会排队重绘"""
+        if str(widget.cget(key)) != value:
+            widget.config(**{key: value})
+
+    @staticmethod
+    def _set_var_if_diff(var, value):
+        """值相同则跳过set, 避免触发trace回调"""
+        if var.get() != value:
+            var.set(value)
+
     def update_ui_texts(self):
         """更新所有UI组件的文本"""
         self.root.title(_("Oai2Ollama GUI - OpenAI to Ollama API Bridge"))
-        
-        # Toolbar
-        self.theme_btn.config(text=_("🌙 Dark Theme") if self.settings.theme == "darkly" else _("☀️ Light Theme"))
-        self.settings_btn.config(text=_("⚙️ Settings"))
-        self.about_btn.config(text=_("ℹ️ About"))
-        self.stop_btn.config(text=_("⏹️ Stop"))
-        self.start_btn.config(text=_("▶️ Start"))
-
-        # Config Frame
-        self.config_frame.config(text=_("Server Configuration"))
-        self.api_key_label.config(text=_("API Key:"))
-        self.show_key_check.config(text=_("Show"))
-        self.base_url_label.config(text=_("Base URL:"))
-        self.listen_addr_label.config(text=_("Listen Address:"))
-        self.port_label.config(text=_("Port:"))
-        self.open_docs_btn.config(text=_("Open API Docs"))
-        self.capabilities_label.config(text=_("Capabilities:"))
-        self.capabilities_hint.config(text=_("(comma-separated, e.g., tools, vision, embedding)"))
-        self.intercept_label.config(text=_("Intercept Model List:"))
-        self.intercept_check.config(text=_("Enable"))
-        self.intercept_settings_btn.config(text=_("Settings"))
-        self.extra_models_label.config(text=_("Extra Models:"))
-        self.extra_models_hint.config(text=_("(comma-separated, e.g., gpt-4, gpt-3.5-turbo)"))
-        
-        # Log Frame
-        self.log_frame.config(text=_("Server Log"))
-        self.clear_log_btn.config(text=_("Clear Log"))
-        self.save_log_btn.config(text=_("Save Log"))
-        self.auto_scroll_check.config(text=_("Auto-scroll"))
-        
+
+        # 静态文本走注册表
+        for widget, msgid in self._i18n_widgets:
+            self._set_if_diff(widget, "text", _(msgid))
+
+        # 文字依赖当前状态的控件
+        self._set_if_diff(self.theme_btn, "text", _("🌙 Dark Theme") if self.settings.theme == "darkly" else _("☀️ Light Theme"))
+
         # Statusbar
-        self.status_label.config(text=_("Ready"))
+        self._set_if_diff(self.status_label, "text", _("Ready"))
         is_running = self.server and self.server.is_running
         status_text = _("Server: Running on {host}:{port}").format(host=self.settings.host, port=self.settings.port) if is_running else _("Server: Stopped")
-        self.server_status_label.config(text=status_text)
+        self._set_if_diff(self.server_status_label, "text", status_text)
         
     def create_toolbar(self):
         toolbar = ttk.Frame(self.root)
@@ -773,9 +1018,11 @@ class MainApplication:
         self.lang_menu = Menu(self.lang_menu_btn, tearoff=0)
         self.lang_menu_btn['menu'] = self.lang_menu
         
-        for code, name in locale_manager.supported_languages.items():
+        # 每个条目自带语言代码; 'active'条目在原生菜单(Windows/macOS)上
+        # 回调触发前就被清掉, 不能用它反查点击了哪一项
+        for code, name in locale_manager.sorted_languages:
             self.lang_menu.add_command(label=name, command=lambda c=code: self.switch_language_and_update_ui(c))
-        
+
         self.settings_btn = ttk.Button(toolbar, command=self.open_settings, width=8)
         self.settings_btn.pack(side=LEFT, padx=2)
         self.about_btn = ttk.Button(toolbar, command=self.show_about, width=8)
@@ -812,6 +1059,9 @@ class MainApplication:
         advanced_frame = ttk.Frame(self.config_frame); advanced_frame.pack(fill=X, pady=5)
         self.capabilities_label = ttk.Label(advanced_frame, width=12); self.capabilities_label.grid(row=0, column=0, sticky=W, padx=(0, 5))
         self.capabilities_var = tk.StringVar(value=", ".join(self.settings.capabilities))
+        # 文本变化时重新解析一次并缓存, 启动服务器时直接取缓存
+        self._caps_cache = list(self.settings.capabilities)
+        self.capabilities_var.trace_add('write', self._on_caps_changed)
         ttk.Entry(advanced_frame, textvariable=self.capabilities_var, width=40).grid(row=0, column=1, sticky=W, padx=(0, 5))
         self.capabilities_hint = ttk.Label(advanced_frame, foreground="gray"); self.capabilities_hint.grid(row=0, column=2, sticky=W)
         intercept_frame = ttk.Frame(advanced_frame); intercept_frame.grid(row=1, column=0, columnspan=3, sticky=(W,E), pady=(5,0))
@@ -823,6 +1073,8 @@ class MainApplication:
         self.intercept_settings_btn.grid(row=0, column=2, sticky=W)
         self.extra_models_label = ttk.Label(advanced_frame, width=12); self.extra_models_label.grid(row=2, column=0, sticky=W, padx=(0, 5), pady=(5,0))
         self.models_var = tk.StringVar(value=", ".join(self.settings.models))
+        self._models_cache = list(self.settings.models)
+        self.models_var.trace_add('write', self._on_models_changed)
         ttk.Entry(advanced_frame, textvariable=self.models_var, width=40).grid(row=2, column=1, sticky=W, padx=(0, 5), pady=(5,0))
         self.extra_models_hint = ttk.Label(advanced_frame, foreground="gray"); self.extra_models_hint.grid(row=2, column=2, sticky=W, pady=(5,0))
 
@@ -837,9 +1089,17 @@ class MainApplication:
         self.auto_scroll_var = tk.BooleanVar(value=True)
         self.auto_scroll_check = ttk.Checkbutton(control_frame, variable=self.auto_scroll_var)
         self.auto_scroll_check.pack(side=LEFT, padx=(10, 0))
-        self.log_text = ScrolledText(self.log_frame, height=15, autohide=True,
-                                     bootstyle="dark" if self.settings.theme == "darkly" else "light")
-        self.log_text.pack(fill=BOTH, expand=True)
+        # 按行组织的Treeview日志视图: Text控件按总内容量做布局, 行式视图
+        # 只在可见区域做绘制, 大量日志下不再拖慢界面
+        self.log_lines = deque(maxlen=MAX_LOG_LINES)
+        tree_frame = ttk.Frame(self.log_frame)
+        tree_frame.pack(fill=BOTH, expand=True)
+        self.log_tree = ttk.Treeview(tree_frame, columns=("msg",), show="", height=15)
+        self.log_tree.column("msg", anchor=W, stretch=True)
+        log_scrollbar = ttk.Scrollbar(tree_frame, orient=VERTICAL, command=self.log_tree.yview)
+        self.log_tree.configure(yscrollcommand=log_scrollbar.set)
+        self.log_tree.pack(side=LEFT, fill=BOTH, expand=True)
+        log_scrollbar.pack(side=RIGHT, fill=Y)
 
     def create_statusbar(self):
         self.statusbar = ttk.Frame(self.root)
@@ -853,26 +1113,34 @@ class MainApplication:
         if self.settings.theme == "darkly":
             self.settings.theme = "litera"
             self.style.theme_use("litera")
-            self.log_text.config(bootstyle="light")
         else:
             self.settings.theme = "darkly"
             self.style.theme_use("darkly")
-            self.log_text.config(bootstyle="dark")
         self.update_ui_texts() # 更新主题按钮文字
         self.configure_treeview_style()
         self.save_config()
 
     def configure_treeview_style(self):
-        if self.settings.theme == "darkly":
-            style_config = {"borderwidth": 1, "relief": "solid", "rowheight": 25, "background": "#2b2b2b", "fieldbackground": "#2b2b2b", "foreground": "white"}
-            map_config = {"background": [("selected", "#0d6efd")], "foreground": [("selected", "white")]}
-        else:
-            style_config = {"borderwidth": 1, "relief": "solid", "rowheight": 25, "background": "white", "fieldbackground": "white", "foreground": "black"}
-            map_config = {"background": [("selected", "#0d6efd")], "foreground": [("selected", "white")]}
+        # 主题没变时样式字典完全相同, 跳过对选项数据库的Tcl调用
+        if self._active_tree_theme == self.settings.theme:
+            return
+        self._active_tree_theme = self.settings.theme
+        style_config = DARK_TREE_CONFIG if self.settings.theme == "darkly" else LIGHT_TREE_CONFIG
         self.style.configure("Treeview", **style_config)
-        self.style.map("Treeview", **map_config)
+        self.style.map("Treeview", **TREE_MAP_CONFIG)
         self.style.configure("Treeview.Heading", borderwidth=1, relief="solid")
 
+    @staticmethod
+    def _parse_csv(text):
+        """解析逗号分隔列表, 去掉空白和空项"""
+        return [item.strip() for item in text.split(",") if item.strip()]
+
+    def _on_caps_changed(self, *args):
+        self._caps_cache = self._parse_csv(self.capabilities_var.get())
+
+    def _on_models_changed(self, *args):
+        self._models_cache = self._parse_csv(self.models_var.get())
+
     def toggle_api_key_visibility(self):
         self.api_key_entry.config(show="" if self.show_key_var.get() else "*")
 
@@ -885,12 +1153,12 @@ class MainApplication:
         self.settings.base_url = self.base_url_var.get()
         self.settings.host = self.host_var.get()
         self.settings.port = self.port_var.get()
-        cap_str = self.capabilities_var.get().strip()
-        self.settings.capabilities = [c.strip() for c in cap_str.split(",")] if cap_str else []
-        model_str = self.models_var.get().strip()
-        self.settings.models = [m.strip() for m in model_str.split(",")] if model_str else []
+        self.settings.capabilities = list(self._caps_cache)
+        self.settings.models = list(self._models_cache)
         self.save_config()
-        self.server = Oai2OllamaServer(self.settings, self.add_log)
+        # 复用已有的服务器实例(FastAPI app和路由只构建一次), 设置对象是共享的
+        if self.server is None:
+            self.server = Oai2OllamaServer(self.settings, self.add_log)
         self.server.start()
         self.start_btn.config(state=DISABLED); self.stop_btn.config(state=NORMAL)
         self.status_label.config(text=_("Server started"))
@@ -900,7 +1168,7 @@ class MainApplication:
 
     def stop_server(self):
         if self.server:
-            self.server.stop(); self.server = None
+            self.server.stop()
         self.start_btn.config(state=NORMAL); self.stop_btn.config(state=DISABLED)
         self.status_label.config(text=_("Server stopped"))
         self.update_ui_texts() # 更新状态栏
@@ -908,20 +1176,46 @@ class MainApplication:
             if hasattr(widget, 'config'): widget.config(state=NORMAL)
 
     def add_log(self, message):
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # time.strftime在C层执行且不构建datetime对象;
+        # 同一秒内的连续日志直接复用已格式化的时间戳
+        now = time.time()
+        second = int(now)
+        last_second, timestamp = self._log_ts_cache
+        if second != last_second:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._log_ts_cache = (second, timestamp)
         self.log_queue.put(f"[{timestamp}] {message}")
+        try:
+            # when="tail"时event_generate线程安全, 可从服务器线程直接唤醒UI
+            self.root.event_generate("<<LogArrived>>", when="tail")
+        except tk.TclError:
+            pass  # 主窗口已销毁
 
-    def update_logs(self):
+    def drain_logs(self, event=None):
+        batch = []
         try:
-            while not self.log_queue.empty():
-                message = self.log_queue.get_nowait()
-                self.log_text.insert(END, message + "\n")
-                if self.auto_scroll_var.get(): self.log_text.see(END)
-        except queue.Empty: pass
-        self.root.after(100, self.update_logs)
+            while True:
+                batch.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if not batch:
+            return
+        self.log_lines.extend(batch)
+        insert = self.log_tree.insert
+        for line in batch:
+            insert("", END, values=(line,))
+        # 环形缓冲: 超出上限时一次性删除最旧的行
+        children = self.log_tree.get_children()
+        excess = len(children) - MAX_LOG_LINES
+        if excess > 0:
+            self.log_tree.delete(*children[:excess])
+        if self.auto_scroll_var.get(): self.log_tree.yview_moveto(1.0)
 
     def clear_logs(self):
-        self.log_text.delete(1.0, END); self.status_label.config(text=_("Log cleared"))
+        children = self.log_tree.get_children()
+        if children: self.log_tree.delete(*children)
+        self.log_lines.clear()
+        self.status_label.config(text=_("Log cleared"))
 
     def save_logs(self):
         from tkinter import filedialog
@@ -929,13 +1223,19 @@ class MainApplication:
             title=_("Save Log"), defaultextension=".txt",
             filetypes=[(_("Text files"), "*.txt"), (_("All files"), "*.*")])
         if filename:
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.log_text.get(1.0, END))
-                self.status_label.config(text=_("Log saved to: {filename}").format(filename=filename))
-                messagebox.showinfo(_("Success"), _("Log saved"))
-            except Exception as e:
-                messagebox.showerror(_("Error"), _("Failed to save log: {error}").format(error=e))
+            # 内容在主线程截取, 写入放到I/O线程, 结果回到主线程提示
+            content = "\n".join(self.log_lines) + "\n"
+            def write_log():
+                try:
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        f.write(content)
+                    def report_ok():
+                        self.status_label.config(text=_("Log saved to: {filename}").format(filename=filename))
+                        messagebox.showinfo(_("Success"), _("Log saved"))
+                    self.root.after(0, report_ok)
+                except Exception as e:
+                    self.root.after(0, lambda e=e: messagebox.showerror(_("Error"), _("Failed to save log: {error}").format(error=e)))
+            self._io_executor.submit(write_log)
 
     def open_api_docs(self):
         if self.server and self.server.is_running:
@@ -960,7 +1260,7 @@ class MainApplication:
         
         start_minimized_var = tk.BooleanVar(value=self.settings.start_minimized)
         ttk.Checkbutton(frame, text=_("Start minimized to tray"), variable=start_minimized_var).pack(anchor=W, pady=5)
-        
+
         btn_frame = ttk.Frame(frame); btn_frame.pack(side=BOTTOM, fill=X, pady=(20, 0))
         def save_settings():
             self.settings.auto_start = auto_start_var.get()
@@ -974,7 +1274,14 @@ class MainApplication:
         ttk.Button(btn_frame, text=_("Cancel"), command=settings_window.destroy).pack(side=RIGHT)
 
     def show_about(self):
-        about_text = f"""Oai2Ollama GUI
+        # 文本只依赖当前语言, 构建一次后复用, 语言切换时失效
+        if self._about_text is None:
+            self._about_text = self._build_about_text()
+        messagebox.showinfo(_("About"), self._about_text)
+
+    @staticmethod
+    def _build_about_text():
+        return f"""Oai2Ollama GUI
 {_('Version')}: {VERSION}
 
 OpenAI to Ollama API Bridge
@@ -989,14 +1296,14 @@ OpenAI to Ollama API Bridge
 
 {_('Author')}: Oai2Ollama Team
 {_('License')}: MIT License"""
-        messagebox.showinfo(_("About"), about_text)
 
     def on_intercept_models_toggle(self):
         self.settings.intercept_models_enabled = self.intercept_models_var.get()
         self.save_config()
 
     def open_model_intercept_window(self):
-        ModelInterceptWindow(parent=self.root, settings_manager=self.settings, on_save_callback=self.save_config)
+        window = ModelInterceptWindow(parent=self.root, settings_manager=self.settings, on_save_callback=self.save_config)
+        self._localizable_toplevels.add(window)
 
     def load_config(self):
         try:
@@ -1010,47 +1317,86 @@ OpenAI to Ollama API Bridge
             logger.error(f"Failed to load config: {e}")
 
     def save_config(self):
+        """请求保存配置; 500ms内的连续调用合并为一次磁盘写入"""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(500, self._flush_config)
+
+    def _flush_config(self):
+        self._save_after_id = None
+        # 下划线开头的属性是运行时缓存, 不持久化
+        config = {key: value for key, value in self.settings.__dict__.items() if not key.startswith('_')}
+        self._io_executor.submit(self._write_config, config)
+
+    def _write_config(self, config):
         try:
-            config = {key: value for key, value in self.settings.__dict__.items()}
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
+            # 写临时文件再原子改名, 避免崩溃留下半写的配置
+            tmp_path = self.config_path.with_name(self.config_path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                # orjson的C编码器远快于stdlib的纯Python美化输出, 且总是UTF-8
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            os.replace(tmp_path, self.config_path)
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
 
     def apply_saved_config(self):
-        if hasattr(self, 'api_key_var'): self.api_key_var.set(self.settings.api_key)
-        if hasattr(self, 'base_url_var'): self.base_url_var.set(self.settings.base_url)
-        if hasattr(self, 'host_var'): self.host_var.set(self.settings.host)
-        if hasattr(self, 'port_var'): self.port_var.set(self.settings.port)
-        if hasattr(self, 'capabilities_var'): self.capabilities_var.set(", ".join(self.settings.capabilities))
-        if hasattr(self, 'models_var'): self.models_var.set(", ".join(self.settings.models))
-        if hasattr(self, 'intercept_models_var'): self.intercept_models_var.set(self.settings.intercept_models_enabled)
+        if hasattr(self, 'api_key_var'): self._set_var_if_diff(self.api_key_var, self.settings.api_key)
+        if hasattr(self, 'base_url_var'): self._set_var_if_diff(self.base_url_var, self.settings.base_url)
+        if hasattr(self, 'host_var'): self._set_var_if_diff(self.host_var, self.settings.host)
+        if hasattr(self, 'port_var'): self._set_var_if_diff(self.port_var, self.settings.port)
+        if hasattr(self, 'capabilities_var'): self._set_var_if_diff(self.capabilities_var, ", ".join(self.settings.capabilities))
+        if hasattr(self, 'models_var'): self._set_var_if_diff(self.models_var, ", ".join(self.settings.models))
+        if hasattr(self, 'intercept_models_var'): self._set_var_if_diff(self.intercept_models_var, self.settings.intercept_models_enabled)
     
     def set_window_icon(self):
-        """设置窗口图标"""
+        """设置窗口图标; 只做Tk侧设置, PIL图像留给托盘按需加载"""
         icon_path = self.base_path / "icon.ico"
         icon_png_path = self.base_path / "icon.png"
-        
+
         try:
             if icon_path.exists():
                 self.root.iconbitmap(str(icon_path))
-                self.icon_image = Image.open(str(icon_path))
+                self._icon_source = icon_path
             elif icon_png_path.exists():
-                self.icon_image = Image.open(str(icon_png_path))
+                # tk.PhotoImage自己会读PNG, 窗口图标不需要经过PIL
                 self.root.iconphoto(True, tk.PhotoImage(file=str(icon_png_path)))
+                self._icon_source = icon_png_path
             else:
-                # 创建默认图标
-                self.icon_image = self.create_default_icon()
+                self._icon_source = None
         except Exception as e:
             logger.error(f"设置图标失败: {e}")
-            self.icon_image = self.create_default_icon()
-    
+            self._icon_source = None
+
+    @property
+    def icon_image(self):
+        """托盘用的PIL图像, 首次访问时才加载或绘制"""
+        if self._icon_image is None:
+            try:
+                if self._icon_source is not None:
+                    self._icon_image = Image.open(str(self._icon_source))
+                else:
+                    self._icon_image = self.create_default_icon()
+            except Exception:
+                self._icon_image = self.create_default_icon()
+        return self._icon_image
+
     def create_default_icon(self):
-        """创建默认图标"""
+        """创建默认图标; 绘制结果缓存到磁盘, 后续启动直接读文件"""
+        cache_path = Path.home() / ".cache" / "oai2ollama" / "icon.png"
+        try:
+            if cache_path.exists():
+                return Image.open(str(cache_path))
+        except Exception:
+            pass
         img = Image.new('RGB', (64, 64), color='#0d6efd')
         draw = ImageDraw.Draw(img)
         draw.rectangle([8, 8, 56, 56], outline='white', width=2)
         draw.text((20, 20), "O2O", fill='white')
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            img.save(str(cache_path))
+        except Exception:
+            pass
         return img
     
     def setup_tray(self):
@@ -1095,7 +1441,11 @@ OpenAI to Ollama API Bridge
     def quit_application(self):
         if self.server and self.server.is_running: self.stop_server()
         if ENABLE_TRAY and hasattr(self, 'tray_icon') and self.tray_icon: self.tray_icon.stop()
-        self.save_config()
+        # 退出时同步落盘, 不能等防抖定时器; 等I/O线程写完再销毁窗口
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._flush_config()
+        self._io_executor.shutdown(wait=True)
         self.root.quit(); self.root.destroy()
 
 class QuickStartDialog: